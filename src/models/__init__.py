@@ -1,3 +1,3 @@
-from .table import Table
+from .table import TABLE_STATUS_VALUES, Table, TableStatus
 
-__all__ = ["Table"]
+__all__ = ["Table", "TableStatus", "TABLE_STATUS_VALUES"]
@@ -8,16 +8,23 @@ class TableStatus(Enum):
     UNDER_MAINTENANCE = "Under Maintenance"
 
 
+TABLE_STATUS_VALUES = tuple(status.value for status in TableStatus)
+
+
 class Table:
     def __init__(
         self,
         table_number: int,
         capacity: int,
         status: TableStatus = TableStatus.AVAILABLE,
+        grid_x: int = 0,
+        grid_y: int = 0,
     ):
         self.table_number = table_number
         self.capacity = capacity
         self.status = status
+        self.grid_x = grid_x
+        self.grid_y = grid_y
 
     def update_status(self, new_status: TableStatus):
         self.status = new_status